@@ -11,9 +11,9 @@ from astrbot.core.message.components import File
 from astrbot.core.message.message_event_result import MessageChain
 from astrbot.core.agent.tool import ToolSet
 
-from .utils.document_utils import DocumentManager, MarkdownToWordConverter
+from .utils.document_utils import DocumentManager, md_to_word_async
 from .utils.scholar import ArxivTool, CNKITool
-from .utils.smart_reader import smart_read_to_markdown
+from .utils.smart_reader import close_smart_reader, smart_read_to_markdown
 
 
 @register("deepresearch", "miaomiao", "基于Gemini的简单deepresearch实现", "0.0.1")
@@ -48,6 +48,7 @@ class MyPlugin(Star):
 
     async def terminate(self):
         """可选择实现异步的插件销毁方法，当插件被卸载/停用时会调用。"""
+        await close_smart_reader()
 
 @dataclass
 class GeminiSearchTool(FunctionTool[AstrAgentContext]):
@@ -298,7 +299,6 @@ class DocumentProcessor(FunctionTool[AstrAgentContext]):
         self, context: ContextWrapper[AstrAgentContext], **kwargs
     ) -> ToolExecResult:
         dm = DocumentManager(base_dir="./data/plugin_data/astrbot_plugin_AssistantResearchTeam")
-        mtw = MarkdownToWordConverter()
 
         document_type = kwargs.get("document_type", "")
         document_name = kwargs.get("document_name", "")
@@ -314,7 +314,7 @@ class DocumentProcessor(FunctionTool[AstrAgentContext]):
                     filepath = dm.create(document_name, document_content)
                     return f"Markdown 文件已创建: {filepath}"
                 elif document_type == "docx":
-                    filepath = mtw.convert(document_content, document_name)
+                    filepath = await md_to_word_async(document_content, document_name, fast=True)
                     return f"Word 文件已创建: {filepath}"
                 else:
                     return "不支持的文档类型。"
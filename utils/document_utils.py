@@ -6,13 +6,28 @@
 - Markdown 转 Word 文档（保留格式）
 """
 
+import asyncio
+import os
 import re
+import zipfile
+from functools import lru_cache
 from pathlib import Path
+from xml.sax.saxutils import escape
 
+import docx
 from docx import Document
 from docx.oxml.ns import qn
 from docx.shared import Inches, Pt
 
+_RE_ORDERED = re.compile(r"^\d+\.\s")
+# 粗体 / 斜体 / 行内代码，一次扫描按出现顺序匹配
+_RE_INLINE = re.compile(r"\*\*(?P<b>.+?)\*\*|\*(?P<i>.+?)\*|`(?P<c>.+?)`")
+_RE_TABLE_SEPARATOR = re.compile(r"^:?-{3,}:?$")
+_HORIZONTAL_RULES = frozenset({"---", "***", "___"})
+_QN_EASTASIA = qn("w:eastAsia")
+# XML 1.0 不允许出现的控制字符
+_RE_XML_INVALID = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
 
 class DocumentManager:
     """文档管理器，用于管理 Markdown 文件和转换为 Word"""
@@ -82,10 +97,12 @@ class DocumentManager:
         filepath = self._get_path(filename)
 
         if append and filepath.exists():
-            existing = filepath.read_text(encoding="utf-8")
-            content = existing + "\n" + content
-
-        filepath.write_text(content, encoding="utf-8")
+            # 直接以追加模式写入，无需读回整个文件
+            with filepath.open("a", encoding="utf-8") as f:
+                f.write("\n")
+                f.write(content)
+        else:
+            filepath.write_text(content, encoding="utf-8")
         return str(filepath)
 
     def delete(self, filename: str) -> bool:
@@ -112,7 +129,12 @@ class DocumentManager:
         Returns:
             文件名列表
         """
-        return [f.name for f in self.base_dir.glob("*.md")]
+        with os.scandir(self.base_dir) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+            ]
 
     def exists(self, filename: str) -> bool:
         """检查文件是否存在"""
@@ -124,6 +146,7 @@ class MarkdownToWordConverter:
 
     def __init__(self):
         self.doc = None
+        self._has_quote_style = False
 
     def convert(self, markdown_content: str, output_path: str) -> str:
         """
@@ -136,7 +159,7 @@ class MarkdownToWordConverter:
         Returns:
             生成的 Word 文件路径
         """
-        self.doc = Document()
+        self._begin_document()
 
         lines = markdown_content.split("\n")
         i = 0
@@ -161,33 +184,35 @@ class MarkdownToWordConverter:
                 i += table_line_count
                 continue
 
+            stripped = line.strip()
+            first = stripped[:1]
+
             # 处理标题
-            if line.startswith("#"):
+            if line[:1] == "#":
                 level = len(line) - len(line.lstrip("#"))
                 text = line.lstrip("#").strip()
                 self._add_heading(text, level)
 
             # 处理无序列表
-            elif line.strip().startswith("- ") or line.strip().startswith("* "):
-                text = line.strip()[2:]
-                self._add_list_item(text, ordered=False)
+            elif first in ("-", "*") and stripped[1:2] == " ":
+                self._add_list_item(stripped[2:], ordered=False)
 
             # 处理有序列表
-            elif re.match(r"^\d+\.\s", line.strip()):
-                text = re.sub(r"^\d+\.\s", "", line.strip())
+            elif first.isdigit() and _RE_ORDERED.match(stripped):
+                text = _RE_ORDERED.sub("", stripped, count=1)
                 self._add_list_item(text, ordered=True)
 
             # 处理引用
-            elif line.startswith(">"):
+            elif line[:1] == ">":
                 text = line.lstrip(">").strip()
                 self._add_quote(text)
 
             # 处理水平线
-            elif line.strip() in ["---", "***", "___"]:
+            elif stripped in _HORIZONTAL_RULES:
                 self._add_horizontal_line()
 
             # 处理普通段落
-            elif line.strip():
+            elif stripped:
                 self._add_paragraph(line)
 
             i += 1
@@ -199,9 +224,18 @@ class MarkdownToWordConverter:
         if not str(output_path).endswith(".docx"):
             output_path = Path(str(output_path) + ".docx")
 
-        self.doc.save(str(output_path))
+        self._save_document(str(output_path))
         return str(output_path)
 
+    def _begin_document(self):
+        """创建空白文档"""
+        self.doc = Document()
+        self._has_quote_style = any(s.name == "Quote" for s in self.doc.styles)
+
+    def _save_document(self, output_path: str):
+        """保存文档"""
+        self.doc.save(output_path)
+
     def _add_heading(self, text: str, level: int):
         """添加标题"""
         # Word 标题级别从 0 开始，Markdown 从 1 开始
@@ -213,51 +247,38 @@ class MarkdownToWordConverter:
         para = self.doc.add_paragraph()
         self._parse_inline_formatting(para, text)
 
+    @staticmethod
+    def _iter_inline_spans(text: str):
+        """按顺序切分内联格式，产出 (格式, 文本)，格式为 "" / "b" / "i" / "c" """
+        pos = 0
+        for match in _RE_INLINE.finditer(text):
+            if match.start() > pos:
+                yield "", text[pos:match.start()]
+            yield match.lastgroup, match.group(match.lastgroup)
+            pos = match.end()
+
+        if pos < len(text):
+            yield "", text[pos:]
+
     def _parse_inline_formatting(self, paragraph, text: str):
         """解析并应用内联格式（粗体、斜体、代码等）"""
-        # 处理粗体
-        parts = re.split(r"\*\*(.+?)\*\*", text)
-        for idx, part in enumerate(parts):
-            if idx % 2 == 0:
-                # 普通文本，继续处理斜体
-                self._add_with_italic(paragraph, part)
-            else:
-                # 粗体文本
-                run = paragraph.add_run(part)
-                run.bold = True
-                self._set_run_font(run)
-
-    def _add_with_italic(self, paragraph, text: str):
-        """处理斜体格式"""
-        parts = re.split(r"\*(.+?)\*", text)
-        for idx, part in enumerate(parts):
-            if idx % 2 == 0:
-                # 普通文本，继续处理行内代码
-                self._add_with_code(paragraph, part)
-            else:
-                # 斜体文本
-                run = paragraph.add_run(part)
-                run.italic = True
-                self._set_run_font(run)
-
-    def _add_with_code(self, paragraph, text: str):
-        """处理行内代码格式"""
-        parts = re.split(r"`(.+?)`", text)
-        for idx, part in enumerate(parts):
-            if idx % 2 == 0:
-                if part:
-                    run = paragraph.add_run(part)
-                    self._set_run_font(run)
-            else:
+        for kind, span in self._iter_inline_spans(text):
+            run = paragraph.add_run(span)
+            if kind == "c":
                 # 代码文本
-                run = paragraph.add_run(part)
                 run.font.name = "Consolas"
                 run.font.size = Pt(10)
+                continue
+            if kind == "b":
+                run.bold = True
+            elif kind == "i":
+                run.italic = True
+            self._set_run_font(run)
 
     def _set_run_font(self, run, font_name: str = "微软雅黑"):
         """设置 run 的字体，支持中文"""
         run.font.name = font_name
-        run._element.rPr.rFonts.set(qn("w:eastAsia"), font_name)
+        run._element.rPr.rFonts.set(_QN_EASTASIA, font_name)
 
     def _add_list_item(self, text: str, ordered: bool = False):
         """添加列表项"""
@@ -269,7 +290,7 @@ class MarkdownToWordConverter:
         """添加引用块"""
         para = self.doc.add_paragraph()
         para.paragraph_format.left_indent = Inches(0.5)
-        para.style = "Quote" if "Quote" in [s.name for s in self.doc.styles] else None
+        para.style = "Quote" if self._has_quote_style else None
         self._parse_inline_formatting(para, text)
 
     def _add_code_block(self, code: str, language: str = ""):
@@ -356,7 +377,7 @@ class MarkdownToWordConverter:
     def _is_table_separator(cells: list[str], expected_cols: int) -> bool:
         if expected_cols <= 0 or len(cells) != expected_cols:
             return False
-        return all(re.match(r"^:?-{3,}:?$", cell.strip()) for cell in cells)
+        return all(_RE_TABLE_SEPARATOR.match(cell.strip()) for cell in cells)
 
     @staticmethod
     def _parse_table_column_alignments(cells: list[str]) -> list[int | None]:
@@ -419,21 +440,210 @@ class MarkdownToWordConverter:
                     run.bold = True
 
 
-def md_to_word(markdown_content: str, output_path: str) -> str:
+@lru_cache(maxsize=1)
+def _load_docx_template() -> tuple[dict[str, bytes], str, str]:
+    """
+    读取 python-docx 自带的默认模板
+
+    Returns:
+        (除 document.xml 外的所有部件, <w:body> 之前的 XML, <w:sectPr> 开始的 XML)
+    """
+    template_path = Path(docx.__file__).parent / "templates" / "default.docx"
+    with zipfile.ZipFile(template_path) as zf:
+        parts = {name: zf.read(name) for name in zf.namelist()}
+
+    document_xml = parts.pop("word/document.xml").decode("utf-8")
+    body_start = document_xml.index("<w:body>") + len("<w:body>")
+    sect_start = document_xml.rindex("<w:sectPr")
+    return parts, document_xml[:body_start], document_xml[sect_start:]
+
+
+class FastMarkdownToWordConverter(MarkdownToWordConverter):
+    """
+    快速 Markdown 转 Word 转换器
+
+    解析逻辑与 MarkdownToWordConverter 相同，但跳过 python-docx 的对象模型，
+    直接拼接 word/document.xml 并打包，适合超大文档的导出。
+    样式沿用 python-docx 默认模板，输出效果与普通模式一致。
+    """
+
+    # Word 默认模板的正文宽度（twips）：12240 - 1800 * 2
+    _BLOCK_WIDTH = 8640
+    _ALIGNMENTS = {0: "left", 1: "center", 2: "right"}
+
+    def __init__(self):
+        super().__init__()
+        self._body: list[str] = []
+
+    def _begin_document(self):
+        self._body = []
+
+    def _save_document(self, output_path: str):
+        parts, head, tail = _load_docx_template()
+        document_xml = head + "".join(self._body) + tail
+        with zipfile.ZipFile(
+            output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            for name, data in parts.items():
+                zf.writestr(name, data)
+            zf.writestr("word/document.xml", document_xml)
+        self._body = []
+
+    @staticmethod
+    def _text_xml(text: str) -> str:
+        """将文本转为 run 内容，换行和制表符转为对应元素"""
+        pieces = []
+        for line_idx, line in enumerate(_RE_XML_INVALID.sub("", text).split("\n")):
+            if line_idx:
+                pieces.append("<w:br/>")
+            for tab_idx, chunk in enumerate(line.split("\t")):
+                if tab_idx:
+                    pieces.append("<w:tab/>")
+                if chunk:
+                    pieces.append(f'<w:t xml:space="preserve">{escape(chunk)}</w:t>')
+        return "".join(pieces)
+
+    @classmethod
+    def _run_xml(
+        cls,
+        text: str,
+        bold: bool = False,
+        italic: bool = False,
+        font_name: str | None = "微软雅黑",
+        size: int | None = None,
+    ) -> str:
+        """生成单个 run，size 单位为磅"""
+        props = []
+        if font_name == "Consolas":
+            props.append('<w:rFonts w:ascii="Consolas" w:hAnsi="Consolas"/>')
+        elif font_name:
+            props.append(
+                f'<w:rFonts w:ascii="{font_name}" w:hAnsi="{font_name}" w:eastAsia="{font_name}"/>'
+            )
+        if bold:
+            props.append("<w:b/>")
+        if italic:
+            props.append("<w:i/>")
+        if size:
+            props.append(f'<w:sz w:val="{size * 2}"/>')
+        rpr = f"<w:rPr>{''.join(props)}</w:rPr>" if props else ""
+        return f"<w:r>{rpr}{cls._text_xml(text)}</w:r>"
+
+    def _inline_xml(self, text: str, bold: bool = False) -> str:
+        """生成带内联格式的 run 序列"""
+        runs = []
+        for kind, span in self._iter_inline_spans(text):
+            if kind == "c":
+                runs.append(self._run_xml(span, bold=bold, font_name="Consolas", size=10))
+            else:
+                runs.append(self._run_xml(span, bold=bold or kind == "b", italic=kind == "i"))
+        return "".join(runs)
+
+    def _append_paragraph(self, content: str, style: str | None = None, indent: int | None = None):
+        """追加段落，indent 单位为 twips"""
+        props = []
+        if style:
+            props.append(f'<w:pStyle w:val="{style}"/>')
+        if indent:
+            props.append(f'<w:ind w:left="{indent}"/>')
+        ppr = f"<w:pPr>{''.join(props)}</w:pPr>" if props else ""
+        self._body.append(f"<w:p>{ppr}{content}</w:p>")
+
+    def _add_heading(self, text: str, level: int):
+        heading_level = min(level, 9)
+        style = "Title" if heading_level == 0 else f"Heading{heading_level}"
+        self._append_paragraph(self._run_xml(text, font_name=None) if text else "", style=style)
+
+    def _add_paragraph(self, text: str):
+        self._append_paragraph(self._inline_xml(text))
+
+    def _add_list_item(self, text: str, ordered: bool = False):
+        style = "ListNumber" if ordered else "ListBullet"
+        self._append_paragraph(self._inline_xml(text), style=style)
+
+    def _add_quote(self, text: str):
+        self._append_paragraph(self._inline_xml(text), style="Quote", indent=720)
+
+    def _add_code_block(self, code: str, language: str = ""):
+        self._append_paragraph(
+            self._run_xml(code, font_name="Consolas", size=9), indent=432
+        )
+
+    def _add_horizontal_line(self):
+        self._append_paragraph(self._run_xml("─" * 50, font_name=None))
+
+    def _add_table(self, table_lines: list[str]):
+        header_cells = self._split_table_row(table_lines[0])
+        separator_cells = self._split_table_row(table_lines[1])
+        body_rows = [self._split_table_row(line) for line in table_lines[2:]]
+        column_count = max(
+            len(header_cells),
+            len(separator_cells),
+            *(len(row) for row in body_rows),
+        )
+        if column_count <= 0:
+            return
+
+        alignments = self._normalize_table_row(
+            self._parse_table_column_alignments(separator_cells),
+            column_count,
+            fill=None,
+        )
+        col_width = self._BLOCK_WIDTH // column_count
+
+        parts = [
+            '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+            'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>',
+            f'<w:gridCol w:w="{col_width}"/>' * column_count,
+            "</w:tblGrid>",
+        ]
+        rows = [(header_cells, True)] + [(row, False) for row in body_rows]
+        for row, is_header in rows:
+            parts.append("<w:tr>")
+            for value, alignment in zip(self._normalize_table_row(row, column_count), alignments):
+                jc = self._ALIGNMENTS.get(alignment)
+                ppr = f'<w:pPr><w:jc w:val="{jc}"/></w:pPr>' if jc else ""
+                parts.append(
+                    f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr>'
+                    f"<w:p>{ppr}{self._inline_xml(value, bold=is_header)}</w:p></w:tc>"
+                )
+            parts.append("</w:tr>")
+        parts.append("</w:tbl>")
+        self._body.append("".join(parts))
+
+
+def md_to_word(markdown_content: str, output_path: str, fast: bool = False) -> str:
     """
     便捷函数：将 Markdown 转换为 Word
 
     Args:
         markdown_content: Markdown 内容
         output_path: 输出路径
+        fast: 是否使用直接生成 XML 的快速模式（适合超大文档）
 
     Returns:
         生成的文件路径
     """
-    converter = MarkdownToWordConverter()
+    converter = FastMarkdownToWordConverter() if fast else MarkdownToWordConverter()
     return converter.convert(markdown_content, output_path)
 
 
+async def md_to_word_async(markdown_content: str, output_path: str, fast: bool = False) -> str:
+    """
+    异步版本的 md_to_word，在线程中执行转换，避免阻塞事件循环
+
+    Args:
+        markdown_content: Markdown 内容
+        output_path: 输出路径
+        fast: 是否使用直接生成 XML 的快速模式（适合超大文档）
+
+    Returns:
+        生成的文件路径
+    """
+    return await asyncio.to_thread(md_to_word, markdown_content, output_path, fast)
+
+
 # 测试代码
 if __name__ == "__main__":
     # 测试 DocumentManager
@@ -11,11 +11,11 @@ from .smart_reader import smart_read
 async def fetch_url_content_local(url: str) -> str:
     """
     本地实现的网页抓取工具 (异步版本)。
-    使用无头浏览器加载网页，并提取正文转换为Markdown。
+    抓取网页并提取正文转换为Markdown，必要时使用无头浏览器渲染。
 
     已过时：请直接使用 smart_reader.smart_read() 或 smart_reader.smart_read_to_markdown()
     """
-    result = await smart_read(url, use_playwright=True)
+    result = await smart_read(url)
 
     if result.error:
         return f"Error fetching URL: {result.error}"
@@ -5,18 +5,43 @@
 1. HTML 转 Markdown：使用 Trafilatura 提取正文，丢弃无关元素
 2. PDF 解析：自动检测 PDF 并提取文本
 3. 元数据提取：返回发布时间、作者、引用列表等
+4. 结果缓存：内存 + 磁盘两级缓存，重复读取同一 URL 时直接命中
 """
 
 import asyncio
+import concurrent.futures
+import contextlib
+import hashlib
+import io
+import multiprocessing
+import os
 import re
-from dataclasses import dataclass, field
+import tempfile
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from urllib.parse import urlparse
 
 import aiohttp
+import orjson
 import pymupdf
 import trafilatura
-from playwright.async_api import async_playwright
-from trafilatura.metadata import extract_metadata
+from playwright.async_api import Browser, Playwright, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+try:
+    import hyperscan
+except ImportError:  # 可选依赖，缺失时回退到 re
+    hyperscan = None
+
+
+_RE_BRACKET = re.compile(r"\[(\d+)\]\s*([^\[\]]{10,200})")
+_RE_DOI = re.compile(r"(10\.\d{4,}/[^\s]+)")
+_RE_ARXIV = re.compile(r"(arXiv:\d{4}\.\d{4,5}(?:v\d+)?)", re.IGNORECASE)
+_RE_BLANKS = re.compile(r"\n{3,}")
+_RE_PDF_DATE = re.compile(r"D:(\d{4})(\d{2})(\d{2})")
 
 
 @dataclass
@@ -30,18 +55,116 @@ class ReadResult:
     content_type: str = "html"  # html 或 pdf
     references: list[str] = field(default_factory=list)  # 引用列表
     error: str | None = None
+    etag: str | None = None  # 响应的 ETag，用于条件请求
+    last_modified: str | None = None  # 响应的 Last-Modified，用于条件请求
+
 
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
-async def _fetch_html_with_playwright(url: str) -> str:
-    """使用 Playwright 异步获取渲染后的 HTML"""
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-            locale="zh-CN",
-            timezone_id="Asia/Shanghai",
+# 全局复用的 HTTP 会话，避免每次请求都重新建立 TCP/TLS 连接
+_SESSION: aiohttp.ClientSession | None = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """获取（必要时创建）共享的 aiohttp 会话"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            headers={"User-Agent": _USER_AGENT},
+            timeout=aiohttp.ClientTimeout(total=60),
         )
+    return _SESSION
+
+
+# Trafilatura / PyMuPDF 等 CPU 密集任务专用的线程池，避免占满默认线程池
+_CPU_POOL: concurrent.futures.ThreadPoolExecutor | None = None
+
+
+def _get_cpu_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """获取（必要时创建）CPU 任务线程池"""
+    global _CPU_POOL
+    if _CPU_POOL is None:
+        _CPU_POOL = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(4, os.cpu_count() or 1),
+            thread_name_prefix="smart_reader",
+        )
+    return _CPU_POOL
+
+
+# 全局复用的 Playwright 浏览器进程，每次抓取只新建 context/page
+_PW: Playwright | None = None
+_BROWSER: Browser | None = None
+_BROWSER_LOCK = asyncio.Lock()
+
+
+async def _get_browser() -> Browser:
+    """获取（必要时启动）共享的 Chromium 浏览器"""
+    global _PW, _BROWSER
+    async with _BROWSER_LOCK:
+        if _BROWSER is None or not _BROWSER.is_connected():
+            if _PW is None:
+                _PW = await async_playwright().start()
+            _BROWSER = await _PW.chromium.launch(
+                headless=True,
+                args=["--disable-dev-shm-usage", "--no-sandbox"],
+            )
+        return _BROWSER
+
+
+async def close_smart_reader() -> None:
+    """释放智能阅读器占用的共享资源（插件卸载时调用）"""
+    global _SESSION, _PW, _BROWSER, _PDF_POOL, _CPU_POOL
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+    if _CPU_POOL is not None:
+        _CPU_POOL.shutdown(wait=False, cancel_futures=True)
+        _CPU_POOL = None
+
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is not None:
+            _PDF_POOL.shutdown(wait=False, cancel_futures=True)
+            _PDF_POOL = None
+
+    async with _BROWSER_LOCK:
+        if _BROWSER is not None:
+            await _BROWSER.close()
+            _BROWSER = None
+        if _PW is not None:
+            await _PW.stop()
+            _PW = None
+
+
+# Trafilatura 只需要 DOM，这些资源直接拦截，减少传输量
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _block_heavy_resources(route) -> None:
+    """拦截图片、字体等与正文提取无关的资源"""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _fetch_html_with_playwright(url: str) -> tuple[str, dict[str, str]]:
+    """使用 Playwright 异步获取渲染后的 HTML 及响应头"""
+    browser = await _get_browser()
+    context = await browser.new_context(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        viewport={"width": 1920, "height": 1080},
+        locale="zh-CN",
+        timezone_id="Asia/Shanghai",
+    )
+    try:
+        await context.route("**/*", _block_heavy_resources)
         page = await context.new_page()
 
         # 隐藏 webdriver 特征
@@ -49,72 +172,237 @@ async def _fetch_html_with_playwright(url: str) -> str:
             Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
         """)
 
-        await page.goto(url, wait_until="networkidle", timeout=30000)
-        await page.wait_for_load_state("domcontentloaded")
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        headers = response.headers if response else {}
+
+        # 需要渲染的页面正文多由 XHR 在 DOMContentLoaded 之后加载，
+        # 图片等资源已被拦截，尽量等到网络空闲再取 HTML，超时则直接使用当前内容
+        try:
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except PlaywrightTimeoutError:
+            pass
         html_content = await page.content()
-        await browser.close()
+    finally:
+        await context.close()
+
+    return html_content, headers
 
-    return html_content
+
+def _compile_reference_db():
+    """
+    用 Hyperscan 把三种引用格式的前缀编译进同一个数据库
+
+    只用来一次扫描找出候选起点，完整匹配和分组仍交给 re 在候选位置上完成，
+    因此结果与 re.findall 完全一致。
+    """
+    if hyperscan is None:
+        return None
+    base = hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=[rb"\[\d+\]", rb"10\.\d{4,}/", rb"arXiv:\d{4}\.\d{4,5}"],
+            ids=[0, 1, 2],
+            elements=3,
+            flags=[base, base, base | hyperscan.HS_FLAG_CASELESS],
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+_HS_REFERENCE_DB = _compile_reference_db()
+_HS_SCRATCH = threading.local()  # Hyperscan 的 scratch 不能跨线程共用
+# 引用密集的文本中逐个回调的开销会抵消扫描收益，只对足够长的文本启用 Hyperscan
+_HS_MIN_TEXT_LENGTH = 1_000_000
+
+
+def _scan_reference_starts(text: str) -> tuple[list[int], list[int], list[int]]:
+    """用 Hyperscan 一次扫描，返回三种引用格式各自的候选起点（字符下标，升序）"""
+    data = text.encode("utf-8")
+    byte_starts: tuple[set[int], set[int], set[int]] = (set(), set(), set())
+
+    def on_match(pattern_id, start, end, flags, context):
+        byte_starts[pattern_id].add(start)
+
+    scratch = getattr(_HS_SCRATCH, "scratch", None)
+    if scratch is None:
+        scratch = _HS_SCRATCH.scratch = hyperscan.Scratch(_HS_REFERENCE_DB)
+    _HS_REFERENCE_DB.scan(data, match_event_handler=on_match, scratch=scratch)
+
+    if len(data) == len(text):
+        # 纯 ASCII，字节下标即字符下标
+        return tuple(sorted(starts) for starts in byte_starts)
+
+    # 将 UTF-8 字节下标增量换算为字符下标
+    char_of = {}
+    byte_pos = char_pos = 0
+    for offset in sorted(set().union(*byte_starts)):
+        char_pos += len(data[byte_pos:offset].decode("utf-8"))
+        byte_pos = offset
+        char_of[offset] = char_pos
+    return tuple(sorted(char_of[b] for b in starts) for starts in byte_starts)
+
+
+def _findall_at(pattern: re.Pattern, text: str, starts: list[int]) -> list:
+    """只在候选起点上尝试匹配，返回值与 pattern.findall(text) 相同"""
+    results = []
+    last_end = 0
+    for pos in starts:
+        if pos < last_end:
+            continue
+        match = pattern.match(text, pos)
+        if match:
+            results.append(match.groups() if pattern.groups > 1 else match.group(1))
+            last_end = match.end()
+    return results
+
+
+def _find_reference_candidates(text: str) -> tuple[list, list, list]:
+    """返回 (编号引用, DOI, arXiv) 三类匹配结果"""
+    if _HS_REFERENCE_DB is None or len(text) < _HS_MIN_TEXT_LENGTH:
+        return _RE_BRACKET.findall(text), _RE_DOI.findall(text), _RE_ARXIV.findall(text)
+
+    try:
+        bracket_starts, doi_starts, arxiv_starts = _scan_reference_starts(text)
+    except UnicodeEncodeError:
+        # PyMuPDF 可能返回孤立代理字符，无法编码为 UTF-8，退回 re
+        return _RE_BRACKET.findall(text), _RE_DOI.findall(text), _RE_ARXIV.findall(text)
+    return (
+        _findall_at(_RE_BRACKET, text, bracket_starts),
+        _findall_at(_RE_DOI, text, doi_starts),
+        _findall_at(_RE_ARXIV, text, arxiv_starts),
+    )
 
 
 def _extract_references_from_text(text: str) -> list[str]:
     """从文本中提取引用/参考文献"""
     references = []
+    seen = set()
+    bracket_refs, dois, arxiv_refs = _find_reference_candidates(text)
 
     # 匹配常见的引用格式
     # 1. [1] Author, Title, Year 格式
-    bracket_refs = re.findall(r"\[(\d+)\]\s*([^\[\]]{10,200})", text)
     for num, ref in bracket_refs:
-        references.append(f"[{num}] {ref.strip()}")
+        entry = f"[{num}] {ref.strip()}"
+        if entry not in seen:
+            seen.add(entry)
+            references.append(entry)
+            # 已出现在编号引用中的 DOI / arXiv 编号不再重复收录
+            seen.update(_RE_DOI.findall(entry))
+            seen.update(_RE_ARXIV.findall(entry))
 
     # 2. DOI 链接
-    dois = re.findall(r"(10\.\d{4,}/[^\s]+)", text)
     for doi in dois:
-        if doi not in str(references):
+        if doi not in seen:
+            seen.add(doi)
             references.append(f"DOI: {doi}")
 
     # 3. arXiv 引用
-    arxiv_refs = re.findall(r"(arXiv:\d{4}\.\d{4,5}(?:v\d+)?)", text, re.IGNORECASE)
     for ref in arxiv_refs:
-        if ref not in str(references):
+        if ref not in seen:
+            seen.add(ref)
             references.append(ref)
 
     return references[:50]  # 限制最多 50 条引用
 
 
-async def _read_html(url: str, use_playwright: bool = True) -> ReadResult:
-    """异步读取 HTML 页面并提取内容"""
+def _split_front_matter(text: str) -> tuple[dict[str, str], str]:
+    """拆分 trafilatura with_metadata 输出开头的 "---" 元数据块和正文"""
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---\n", 4)
+    if end == -1:
+        return {}, text
+
+    metadata = {}
+    for line in text[4:end].splitlines():
+        key, sep, value = line.partition(": ")
+        value = value.strip()
+        if not sep or not value:
+            continue
+        # 含特殊字符的值会被输出为 YAML 双引号字符串（与 JSON 字符串兼容）
+        if value.startswith('"'):
+            try:
+                value = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                value = value.strip('"')
+        metadata[key.strip()] = value
+    return metadata, text[end + 5:].lstrip("\n")
+
+
+def _conditional_headers(cached: ReadResult | None) -> dict[str, str]:
+    """根据缓存结果构造条件请求头"""
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+async def _is_not_modified(url: str, cached: ReadResult | None) -> bool:
+    """用 HEAD 条件请求确认内容未变化（返回 304）"""
+    headers = _conditional_headers(cached)
+    if not headers:
+        return False
+    try:
+        session = await _get_session()
+        async with session.head(
+            url,
+            headers=headers,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            return response.status == 304
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
+
+
+async def _read_html(
+    url: str, use_playwright: bool = True, cached: ReadResult | None = None
+) -> ReadResult:
+    """
+    异步读取 HTML 页面并提取内容
+
+    传入已过期的缓存结果 cached 时会发起条件请求，内容未变化则直接返回 cached。
+    """
     try:
         if use_playwright:
-            html_content = await _fetch_html_with_playwright(url)
+            # 先用 HEAD 校验缓存，未变化就不必启动浏览器
+            if await _is_not_modified(url, cached):
+                return cached
+            html_content, headers = await _fetch_html_with_playwright(url)
         else:
             # 使用 aiohttp 进行简单请求，适用于静态页面
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    },
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    response.raise_for_status()
-                    html_content = await response.text()
-
-        # 提取元数据 (trafilatura 是同步的，在线程池中运行)
-        loop = asyncio.get_event_loop()
-        metadata = await loop.run_in_executor(None, extract_metadata, html_content)
-
-        # 提取正文并转为 Markdown
-        text_content = await loop.run_in_executor(
-            None,
+            session = await _get_session()
+            async with session.get(
+                url,
+                headers=_conditional_headers(cached),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 304 and cached is not None:
+                    return cached
+                response.raise_for_status()
+                # 直接交给 trafilatura 原始字节，由其根据 <meta> 等自行识别编码
+                html_content = await response.read()
+                headers = response.headers
+
+        # 一次解析同时提取正文 (Markdown) 和元数据 (trafilatura 是同步的，在线程池中运行)
+        loop = asyncio.get_running_loop()
+        extracted = await loop.run_in_executor(
+            _get_cpu_pool(),
             lambda: trafilatura.extract(
                 html_content,
                 include_comments=False,
                 include_tables=True,
                 include_links=True,
-                output_format="markdown"
+                output_format="markdown",
+                with_metadata=True,
             )
         )
+        metadata, text_content = _split_front_matter(extracted or "")
 
         if not text_content:
             return ReadResult(
@@ -128,65 +416,144 @@ async def _read_html(url: str, use_playwright: bool = True) -> ReadResult:
 
         return ReadResult(
             content=text_content,
-            title=metadata.title if metadata else None,
-            author=metadata.author if metadata else None,
-            publish_date=metadata.date if metadata else None,
+            title=metadata.get("title"),
+            author=metadata.get("author"),
+            publish_date=metadata.get("date"),
             url=url,
             content_type="html",
-            references=references
+            references=references,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
         )
 
     except Exception as e:
         return ReadResult(content="", url=url, error=f"HTML 读取失败: {str(e)}")
 
 
-async def _read_pdf(url: str) -> ReadResult:
-    """异步读取 PDF 文件并提取内容"""
+# 页数超过该阈值的 PDF 按页段分给多个进程并行提取
+# （PyMuPDF 不支持多线程，只能用多进程）
+_PDF_PARALLEL_MIN_PAGES = 64
+_PDF_WORKERS = min(8, os.cpu_count() or 1)
+_PDF_POOL: concurrent.futures.ProcessPoolExecutor | None = None
+_PDF_POOL_LOCK = threading.Lock()
+
+
+def _get_pdf_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """获取（必要时创建）PDF 解析进程池"""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is None:
+            # 进程内已有事件循环、aiohttp 和 Playwright 等线程，fork 可能死锁，
+            # 因此显式使用 forkserver（不支持时用 spawn）
+            methods = multiprocessing.get_all_start_methods()
+            mp_context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            _PDF_POOL = concurrent.futures.ProcessPoolExecutor(
+                max_workers=_PDF_WORKERS, mp_context=mp_context
+            )
+        return _PDF_POOL
+
+
+def _discard_pdf_pool(pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    """丢弃已损坏的进程池，下次使用时重新创建"""
+    global _PDF_POOL
+    with _PDF_POOL_LOCK:
+        if _PDF_POOL is pool:
+            _PDF_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _extract_page_texts(doc, start: int, end: int) -> list[str]:
+    """提取 [start, end) 范围内各页的文本"""
+    texts = []
+    for page_num in range(start, end):
+        text = doc[page_num].get_text("text")
+        if text.strip():
+            texts.append(f"## 第 {page_num + 1} 页\n\n{text}")
+    return texts
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> list[str]:
+    """进程池任务：独立打开文档并提取指定页段的文本"""
+    with pymupdf.open(pdf_path, filetype="pdf") as doc:
+        return _extract_page_texts(doc, start, end)
+
+
+def _extract_pages_parallel(pdf_path: str, page_count: int) -> list[str]:
+    """按页段分给进程池并行提取；进程池损坏时重建并回退到顺序提取"""
+    step = -(-page_count // _PDF_WORKERS)
+    pool = _get_pdf_pool()
     try:
-        # 异步下载 PDF
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                },
-                timeout=aiohttp.ClientTimeout(total=60)
-            ) as response:
-                response.raise_for_status()
-                pdf_bytes = await response.read()
+        futures = [
+            pool.submit(_extract_page_range, pdf_path, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        return [text for future in futures for text in future.result()]
+    except BrokenProcessPool:
+        _discard_pdf_pool(pool)
+        with pymupdf.open(pdf_path, filetype="pdf") as doc:
+            return _extract_page_texts(doc, 0, page_count)
+
+
+async def _read_pdf(url: str, cached: ReadResult | None = None) -> ReadResult:
+    """
+    异步读取 PDF 文件并提取内容
+
+    传入已过期的缓存结果 cached 时会发起条件请求，内容未变化则直接返回 cached。
+    """
+    pdf_path = None
+    try:
+        # 异步下载 PDF，分块写入临时文件，避免整个文件驻留内存
+        session = await _get_session()
+        async with session.get(
+            url,
+            headers=_conditional_headers(cached),
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as response:
+            if response.status == 304 and cached is not None:
+                return cached
+            response.raise_for_status()
+            etag = response.headers.get("etag")
+            last_modified = response.headers.get("last-modified")
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+                pdf_path = f.name
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    f.write(chunk)
 
         # PyMuPDF 是同步的，在线程池中运行
-        loop = asyncio.get_event_loop()
-
-        def parse_pdf(pdf_data: bytes) -> tuple:
-            doc = pymupdf.open(stream=pdf_data, filetype="pdf")
-
-            # 提取元数据
-            metadata = doc.metadata
-            title = metadata.get("title", "")
-            author = metadata.get("author", "")
-            creation_date = metadata.get("creationDate", "")
-
-            # 解析创建日期
-            publish_date = None
-            if creation_date:
-                match = re.match(r"D:(\d{4})(\d{2})(\d{2})", creation_date)
-                if match:
-                    publish_date = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-
-            # 提取所有页面的文本
-            full_text = []
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text("text")
-                if text.strip():
-                    full_text.append(f"## 第 {page_num + 1} 页\n\n{text}")
-
-            doc.close()
+        loop = asyncio.get_running_loop()
+
+        def parse_pdf(pdf_path: str) -> tuple:
+            # with 保证异常时也关闭文档，否则 Windows 上 finally 中的删除会失败
+            with pymupdf.open(pdf_path, filetype="pdf") as doc:
+                # 提取元数据
+                metadata = doc.metadata
+                title = metadata.get("title", "")
+                author = metadata.get("author", "")
+                creation_date = metadata.get("creationDate", "")
+
+                # 解析创建日期
+                publish_date = None
+                if creation_date:
+                    match = _RE_PDF_DATE.match(creation_date)
+                    if match:
+                        publish_date = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+
+                # 提取所有页面的文本
+                page_count = len(doc)
+                full_text = None
+                if page_count < _PDF_PARALLEL_MIN_PAGES:
+                    full_text = _extract_page_texts(doc, 0, page_count)
+
+            # 大文件在关闭文档后交给进程池并行提取
+            if full_text is None:
+                full_text = _extract_pages_parallel(pdf_path, page_count)
+
             return title, author, publish_date, full_text
 
         title, author, publish_date, full_text = await loop.run_in_executor(
-            None, parse_pdf, pdf_bytes
+            _get_cpu_pool(), parse_pdf, pdf_path
         )
 
         content = "\n\n".join(full_text)
@@ -195,7 +562,7 @@ async def _read_pdf(url: str) -> ReadResult:
         references = _extract_references_from_text(content)
 
         # 清理多余空行
-        content = re.sub(r"\n{3,}", "\n\n", content)
+        content = _RE_BLANKS.sub("\n\n", content)
 
         return ReadResult(
             content=content,
@@ -204,12 +571,19 @@ async def _read_pdf(url: str) -> ReadResult:
             publish_date=publish_date,
             url=url,
             content_type="pdf",
-            references=references
+            references=references,
+            etag=etag,
+            last_modified=last_modified,
         )
 
     except Exception as e:
         return ReadResult(content="", url=url, error=f"PDF 读取失败: {str(e)}")
 
+    finally:
+        if pdf_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(pdf_path)
+
 
 def _is_pdf_url(url: str) -> bool:
     """判断 URL 是否指向 PDF 文件"""
@@ -230,25 +604,178 @@ def _is_pdf_url(url: str) -> bool:
     return any(pattern in url.lower() for pattern in pdf_patterns)
 
 
+# ================= 结果缓存 =================
+_CACHE_TTL = float(os.getenv("SMART_READER_CACHE_TTL", "86400"))
+_CACHE_MAX_ENTRIES = 256
+_CACHE_DIR = Path(os.getenv(
+    "SMART_READER_CACHE",
+    "./data/plugin_data/astrbot_plugin_AssistantResearchTeam/smart_reader_cache",
+))
+
+# key -> (写入时间, 结果)，按访问顺序排列，最久未使用的在最前
+# 过期的条目仍会保留，用于携带 ETag / Last-Modified 发起条件请求
+_RESULT_CACHE: dict[str, tuple[float, ReadResult]] = {}
+
+
+def _cache_key(url: str, use_playwright: bool) -> str:
+    # 是否允许 Playwright 回退会影响结果，两种模式分开缓存
+    return hashlib.sha256(f"{url}|playwright={use_playwright}".encode("utf-8")).hexdigest()
+
+
+def _remember(key: str, stored_at: float, result: ReadResult) -> None:
+    """写入内存缓存，超出上限时淘汰最久未使用的条目"""
+    _RESULT_CACHE.pop(key, None)
+    _RESULT_CACHE[key] = (stored_at, result)
+    while len(_RESULT_CACHE) > _CACHE_MAX_ENTRIES:
+        _RESULT_CACHE.pop(next(iter(_RESULT_CACHE)))
+
+
+def _dump_result(result: ReadResult) -> bytes:
+    return orjson.dumps(asdict(result))
+
+
+def _load_result(data: bytes) -> ReadResult:
+    return ReadResult(**orjson.loads(data))
+
+
+def _load_from_disk(key: str) -> tuple[float, ReadResult] | None:
+    """从磁盘缓存读取结果（可能已过期）"""
+    path = _CACHE_DIR / f"{key}.json"
+    try:
+        return path.stat().st_mtime, _load_result(path.read_bytes())
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _save_to_disk(key: str, result: ReadResult) -> None:
+    """写入磁盘缓存，超出上限时删除最旧的文件"""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _CACHE_DIR / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(_dump_result(result))
+        tmp_path.replace(path)
+
+        files = list(_CACHE_DIR.glob("*.json"))
+        if len(files) > _CACHE_MAX_ENTRIES:
+            files.sort(key=lambda f: f.stat().st_mtime)
+            for f in files[:len(files) - _CACHE_MAX_ENTRIES]:
+                f.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+async def _cache_get(key: str) -> tuple[float, ReadResult] | None:
+    """查找缓存，返回 (写入时间, 结果)，由调用方判断是否过期"""
+    entry = _RESULT_CACHE.get(key)
+    if entry is None:
+        entry = await asyncio.to_thread(_load_from_disk, key)
+        if entry is None:
+            return None
+    _remember(key, *entry)
+    return entry
+
+
+async def _cache_put(key: str, result: ReadResult) -> None:
+    _remember(key, time.time(), result)
+    await asyncio.to_thread(_save_to_disk, key, result)
+
+
+# 静态抓取得到的正文少于该长度时，认为页面依赖 JS 渲染，改用 Playwright
+_MIN_STATIC_CONTENT_LENGTH = 200
+
+
+def _parse_hosts(value: str) -> tuple[str, ...]:
+    return tuple(host.strip().lower() for host in value.split(",") if host.strip())
+
+
+# 逗号分隔的域名列表（含子域名）：
+# SMART_READER_PLAYWRIGHT_HOSTS 中的站点直接用 Playwright 渲染，
+# SMART_READER_STATIC_HOSTS 中的站点只用 aiohttp 抓取，不回退到 Playwright
+_PLAYWRIGHT_HOSTS = _parse_hosts(os.getenv("SMART_READER_PLAYWRIGHT_HOSTS", ""))
+_STATIC_HOSTS = _parse_hosts(os.getenv("SMART_READER_STATIC_HOSTS", ""))
+
+
+def _host_in(url: str, hosts: tuple[str, ...]) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == h or host.endswith("." + h) for h in hosts)
+
+
+async def _smart_read_uncached(
+    url: str, use_playwright: bool, cached: ReadResult | None = None
+) -> ReadResult:
+    if _is_pdf_url(url):
+        return await _read_pdf(url, cached)
+
+    if use_playwright and _host_in(url, _PLAYWRIGHT_HOSTS):
+        return await _read_html(url, use_playwright=True, cached=cached)
+
+    # 先用 aiohttp + Trafilatura 直接抓取，内容不足时再回退到 Playwright
+    result = await _read_html(url, use_playwright=False, cached=cached)
+    if not use_playwright or _host_in(url, _STATIC_HOSTS):
+        return result
+    if result.error or len(result.content) < _MIN_STATIC_CONTENT_LENGTH:
+        rendered = await _read_html(url, use_playwright=True, cached=cached)
+        # 渲染失败或没有拿到更多正文时，保留静态抓取的结果
+        if not rendered.error and len(rendered.content) > len(result.content):
+            return rendered
+    return result
+
+
 async def smart_read(url: str, use_playwright: bool = True) -> ReadResult:
     """
     智能阅读器主函数 (异步)
 
     根据 URL 类型自动选择合适的解析方式：
     - PDF 文件：使用 PyMuPDF 解析
-    - HTML 页面：使用 Playwright + Trafilatura 提取
+    - HTML 页面：先用 aiohttp + Trafilatura 提取，失败或正文过短时回退到 Playwright 渲染
+
+    成功的结果会被缓存（默认 24 小时），再次读取同一 URL 时直接返回；
+    缓存过期后会携带 ETag / Last-Modified 发起条件请求，服务器返回 304 时沿用缓存内容。
+    可通过环境变量 SMART_READER_CACHE / SMART_READER_CACHE_TTL 调整缓存目录和有效期。
 
     Args:
         url: 要读取的 URL
-        use_playwright: 是否使用 Playwright 渲染 JS（默认 True）
+        use_playwright: 是否允许回退到 Playwright 渲染 JS（默认 True）
 
     Returns:
         ReadResult: 包含正文、元数据和引用的结果对象
     """
-    if _is_pdf_url(url):
-        return await _read_pdf(url)
-    else:
-        return await _read_html(url, use_playwright)
+    key = _cache_key(url, use_playwright)
+    cached = None
+    entry = await _cache_get(key)
+    if entry is not None:
+        stored_at, cached = entry
+        if time.time() - stored_at < _CACHE_TTL:
+            return cached
+
+    result = await _smart_read_uncached(url, use_playwright, cached)
+    if result.error is None:
+        await _cache_put(key, result)
+    return result
+
+
+async def smart_read_many(
+    urls: list[str], concurrency: int = 8, use_playwright: bool = True
+) -> list[ReadResult | BaseException]:
+    """
+    并发读取多个 URL (异步)
+
+    Args:
+        urls: 要读取的 URL 列表
+        concurrency: 最大并发数（默认 8）
+        use_playwright: 是否允许回退到 Playwright 渲染 JS
+
+    Returns:
+        list: 与 urls 顺序一致的结果列表，单个失败时对应位置为异常对象
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(url: str) -> ReadResult:
+        async with sem:
+            return await smart_read(url, use_playwright)
+
+    return await asyncio.gather(*(_one(u) for u in urls), return_exceptions=True)
 
 
 async def smart_read_to_markdown(url: str, use_playwright: bool = True) -> str:
@@ -257,7 +784,7 @@ async def smart_read_to_markdown(url: str, use_playwright: bool = True) -> str:
 
     Args:
         url: 要读取的 URL
-        use_playwright: 是否使用 Playwright 渲染 JS
+        use_playwright: 是否允许回退到 Playwright 渲染 JS
 
     Returns:
         str: 格式化的 Markdown 内容，包含元数据
@@ -268,42 +795,37 @@ async def smart_read_to_markdown(url: str, use_playwright: bool = True) -> str:
         return f"# 读取失败\n\n**错误**: {result.error}\n**URL**: {url}"
 
     # 构建 Markdown 输出
-    output_parts = []
+    buf = io.StringIO()
 
     # 标题
-    if result.title:
-        output_parts.append(f"# {result.title}")
-    else:
-        output_parts.append("# 未知标题")
+    buf.write(f"# {result.title or '未知标题'}\n\n")
 
     # 元数据块
-    meta_parts = []
     if result.author:
-        meta_parts.append(f"**作者**: {result.author}")
+        buf.write(f"**作者**: {result.author}\n")
     if result.publish_date:
-        meta_parts.append(f"**发布日期**: {result.publish_date}")
-    meta_parts.append(f"**来源**: [{url}]({url})")
-    meta_parts.append(f"**类型**: {result.content_type.upper()}")
+        buf.write(f"**发布日期**: {result.publish_date}\n")
+    buf.write(f"**来源**: [{url}]({url})\n")
+    buf.write(f"**类型**: {result.content_type.upper()}\n\n")
 
-    output_parts.append("\n".join(meta_parts))
-
-    # 分隔线
-    output_parts.append("---")
-
-    # 正文
-    output_parts.append(result.content)
+    # 分隔线 + 正文
+    buf.write("---\n\n")
+    buf.write(result.content)
 
     # 引用列表
     if result.references:
-        output_parts.append("\n---\n## 参考文献\n")
-        for ref in result.references:
-            output_parts.append(f"- {ref}")
+        buf.write("\n\n\n---\n## 参考文献\n")
+        buf.writelines(f"\n\n- {ref}" for ref in result.references)
 
-    return "\n\n".join(output_parts)
+    return buf.getvalue()
 
 
 # --- 测试 ---
 if __name__ == "__main__":
+    # 含孤立代理字符的长文本不应让引用提取抛出 UnicodeEncodeError
+    surrogate_text = "[1] Some reference \ud800 10.1234/abc\n" + "x" * _HS_MIN_TEXT_LENGTH
+    assert _extract_references_from_text(surrogate_text)[0].startswith("[1] Some reference")
+
     async def main():
         # 测试 PDF
         test_url = "http://arxiv.org/pdf/2507.06261v1"